@@ -5,4 +5,50 @@ Oracle to Excel Exporter.
 Использует функциональный подход и возможности Python 3.14.
 """
 
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from oracle_to_excel.database import get_connection, get_db_info
+    from oracle_to_excel.env_config import Settings, load_config, print_config_summary
+    from oracle_to_excel.logger import get_logger, setup_logging
+
 __version__ = '1.0.0'
+
+# Публичные имена загружаются при первом обращении (PEP 562), чтобы
+# `import oracle_to_excel` не импортировал pydantic, sqlalchemy и драйверы БД.
+# main сюда не входит: имя совпадает с подмодулем oracle_to_excel.main, и после
+# его импорта атрибут пакета указывал бы на модуль, а не на функцию.
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    'Settings': ('oracle_to_excel.env_config', 'Settings'),
+    'load_config': ('oracle_to_excel.env_config', 'load_config'),
+    'print_config_summary': ('oracle_to_excel.env_config', 'print_config_summary'),
+    'get_connection': ('oracle_to_excel.database', 'get_connection'),
+    'get_db_info': ('oracle_to_excel.database', 'get_db_info'),
+    'get_logger': ('oracle_to_excel.logger', 'get_logger'),
+    'setup_logging': ('oracle_to_excel.logger', 'setup_logging'),
+}
+
+__all__ = [
+    'Settings',
+    '__version__',
+    'get_connection',
+    'get_db_info',
+    'get_logger',
+    'load_config',
+    'print_config_summary',
+    'setup_logging',
+]
+
+
+def __getattr__(name: str) -> object:
+    """Импортирует публичное имя при первом обращении и кеширует его в модуле."""
+    try:
+        module_name, attr_name = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(importlib.import_module(module_name), attr_name)
+    globals()[name] = value
+    return value
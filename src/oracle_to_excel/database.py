@@ -6,30 +6,87 @@
 """
 from __future__ import annotations
 
+import atexit
+import logging
 import os
 import platform
+import re
 import sqlite3
-from collections.abc import Generator
-from contextlib import contextmanager, suppress
+import threading
+from collections.abc import Callable, Mapping
+from contextlib import AbstractContextManager, suppress
+from functools import cache, lru_cache
 from pathlib import Path as _Path
-from typing import Literal, Protocol, cast
-from urllib.parse import urlparse
-
-try:
-    import psycopg
-except ImportError as err:
-    raise RuntimeError('Модуль psycopg3 не установлен.') from err
-try:
+from types import MappingProxyType, ModuleType, TracebackType
+from typing import TYPE_CHECKING, Final, Literal, Protocol, cast
+from urllib.parse import ParseResult, urlparse
+
+if TYPE_CHECKING:
     import oracledb
-except ImportError as err:
-    raise RuntimeError('Модуль oracledb не установлен.') from err
 
 from oracle_to_excel.logger import get_logger, log_execution_time
 
+# Логгер модуля получаем один раз при импорте, а не в каждой функции
+_LOG: Final[logging.Logger] = get_logger('database')
+
 # Типы с запятой (Python 3.14)
 type DBType = Literal['oracle', 'postgresql', 'sqlite']
 type ConnectionString = str
 
+# Разбор одних и тех же connection string кешируется; размер ограничен, так как
+# строки содержат пароли и не должны накапливаться без предела
+_URL_CACHE_SIZE: Final[int] = 256
+
+# Набор PRAGMA для записи в SQLite: WAL вместо rollback-журнала и fsync только
+# на контрольных точках; передаётся явно через create_connection(sqlite_pragmas=...)
+SQLITE_WAL_PRAGMAS: Final[Mapping[str, str | int]] = MappingProxyType({
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'temp_store': 'MEMORY',
+    'cache_size': -64_000,
+    'mmap_size': 268_435_456,
+})
+
+# Путь к Oracle Instant Client, если lib_dir не задан
+_DEFAULT_ORACLE_LIB_DIR: Final[str] = r'd:\instantclient_12_1'
+
+# Директория модуля — запасное расположение относительных путей SQLite
+_MODULE_DIR: Final[_Path] = _Path(__file__).resolve().parent
+
+# Сериализует однократную инициализацию Oracle thick mode
+_THICK_MODE_LOCK: Final[threading.Lock] = threading.Lock()
+
+# Размеры пулов сессий Oracle (create_connection(..., pooled=True))
+ORACLE_POOL_MIN: Final[int] = 1
+ORACLE_POOL_MAX: Final[int] = 10
+
+# Пулы сессий Oracle по (строка подключения, read_only); создаются при первом
+# pooled-запросе, чтобы read-only сессии не смешивались с пишущими
+_ORACLE_POOLS: dict[tuple[ConnectionString, bool], oracledb.ConnectionPool] = {}
+_ORACLE_POOLS_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+# Драйверы импортируются при первом подключении к соответствующей БД: процессы,
+# работающие только с SQLite, не загружают libpq и клиент Oracle
+@cache
+def _psycopg() -> ModuleType:
+    """Возвращает модуль psycopg, импортируя его при первом вызове."""
+    try:
+        import psycopg  # noqa: PLC0415
+    except ImportError as err:
+        raise RuntimeError('Модуль psycopg3 не установлен.') from err
+    return psycopg
+
+
+@cache
+def _oracledb() -> ModuleType:
+    """Возвращает модуль oracledb, импортируя его при первом вызове."""
+    try:
+        import oracledb  # noqa: PLC0415
+    except ImportError as err:
+        raise RuntimeError('Модуль oracledb не установлен.') from err
+    return oracledb
+
 
 class DBCursor(Protocol):
     """
@@ -129,6 +186,33 @@ class DatabaseTypeDetectionError(ValueError):
     """
 
 
+# Признаки типа БД одним проходом; альтернативы проверяются по порядку, как цепочка
+# if: сначала префикс схемы, затем :memory: и расширение файла, затем порт (fallback
+# для строк без явной схемы)
+_DB_TYPE_RE: Final[re.Pattern[str]] = re.compile(
+    r'(?P<oracle>oracle)'
+    r'|(?P<postgresql>postgres)'
+    r'|(?P<sqlite>sqlite|:memory:\Z|.*\.(?:sqlite3|db)\Z)'
+    r'|(?P<oracle_port>.*?:1521[/@])'
+    r'|(?P<postgresql_port>.*?(?::543[23]/|postgresql://))',
+    re.DOTALL,
+)
+_DB_TYPE_BY_GROUP: Final[MappingProxyType[str, DBType]] = MappingProxyType({
+    'oracle': 'oracle',
+    'postgresql': 'postgresql',
+    'sqlite': 'sqlite',
+    'oracle_port': 'oracle',
+    'postgresql_port': 'postgresql',
+})
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _parse_url(connection_string: ConnectionString) -> ParseResult:
+    """Разбирает connection string; неизменяемый ParseResult безопасно переиспользовать."""
+    return urlparse(connection_string)
+
+
+@lru_cache(maxsize=_URL_CACHE_SIZE)
 def detect_db_type(connection_string: ConnectionString) -> DBType:
     """
     Determine the database type from the connection string.
@@ -142,20 +226,9 @@ def detect_db_type(connection_string: ConnectionString) -> DBType:
     Raises:
         DatabaseTypeDetectionError: If the database type cannot be determined.
     """
-    s = connection_string.lower()
-    # Проверка по префиксу схемы
-    if s.startswith(('oracle', 'oracle+cx_oracle', 'oracle+oracledb')):
-        return 'oracle'
-    if s.startswith(('postgresql', 'postgres', 'postgresql+psycopg', 'postgresql+psycopg3')):
-        return 'postgresql'
-    if s.startswith(('sqlite', 'sqlite3')) or s == ':memory:' or s.endswith(('.sqlite3', '.db')):
-        return 'sqlite'
-
-    # Проверка по порту (fallback для строк без явной схемы)
-    if ':1521/' in s or ':1521@' in s:
-        return 'oracle'
-    if ':5432/' in s or ':5433/' in s or 'postgresql://' in s:
-        return 'postgresql'
+    match = _DB_TYPE_RE.match(connection_string.lower())
+    if match is not None and match.lastgroup is not None:
+        return _DB_TYPE_BY_GROUP[match.lastgroup]
 
     raise DatabaseTypeDetectionError(f'Не удалось определить тип БД: {connection_string}')
 
@@ -168,6 +241,8 @@ def create_connection(
     read_only: bool = False,
     timeout: int = 30,
     lib_dir: str | None = None,
+    pooled: bool = False,
+    sqlite_pragmas: Mapping[str, str | int] | None = None,
 ) -> DatabaseConnection:
     """
     Creates a database connection based on the provided connection string and database type.
@@ -184,6 +259,11 @@ def create_connection(
                    Default is False.
         timeout: The number of seconds to wait for a connection before timing out.
                  Default is 30 seconds.
+        pooled: For Oracle, acquire the session from a process-wide pool instead of
+                opening a new one; closing the connection returns it to the pool.
+                Ignored for PostgreSQL and SQLite. Default is False.
+        sqlite_pragmas: PRAGMA settings applied to a new SQLite connection, e.g.
+                        SQLITE_WAL_PRAGMAS. Ignored for Oracle and PostgreSQL.
 
     Returns:
         A database connection object that implements the DatabaseConnection protocol.
@@ -194,32 +274,20 @@ def create_connection(
         DatabaseTypeDetectionError: If the database type cannot be determined from the
         connection string.
     """
-    logger = get_logger('database')
-    logger.debug('Creating connection to %s database', db_type or 'unknown')
+    _LOG.debug('Creating connection to %s database', db_type or 'unknown')
 
     db_type = db_type or detect_db_type(connection_string)
-    match db_type:
-        case 'oracle':
-            oracle_lib_dir = lib_dir or r'd:\instantclient_12_1'
-            return _create_oracle_connection(
-                connection_string,
-                read_only=read_only,
-                thick_mode=True,
-                lib_dir=oracle_lib_dir,  # ← ИСПОЛЬЗОВАТЬ
-            )
-        case 'postgresql' | 'postgres':
-            return _create_postgresql_connection(
-                connection_string,
-                read_only=read_only,
-                timeout=timeout,
-            )
-        case 'sqlite' | 'sqlite3':
-            return _create_sqlite_connection(
-                connection_string,
-                timeout=timeout,
-            )
-        case _:
-            raise ValueError(f'Неподдерживаемый тип БД: {db_type}')
+    connector = _CONNECTORS.get(db_type)
+    if connector is None:
+        raise ValueError(f'Неподдерживаемый тип БД: {db_type}')
+    return connector(
+        connection_string,
+        read_only=read_only,
+        timeout=timeout,
+        lib_dir=lib_dir,
+        pooled=pooled,
+        sqlite_pragmas=sqlite_pragmas,
+    )
 
 
 # Multi-platform helpers for Oracle thick-mode initialization
@@ -234,7 +302,7 @@ def _normalize_lib_dir(lib_dir: _Path | str | None) -> str | None:
 
 def _autodetect_windows_instantclient() -> str | None:
     """Автоопределение пути к Oracle instant client на Windows."""
-    cand = _Path(r'd:\instantclient_12_1')
+    cand = _Path(_DEFAULT_ORACLE_LIB_DIR)
     return str(cand) if cand.exists() else None
 
 
@@ -268,22 +336,26 @@ def init_oracle_thick_mode(lib_dir: _Path | str | None = None) -> bool:
     Raises:
         RuntimeError: При критических ошибках инициализации.
     """
-    lib_dir_str = _normalize_lib_dir(lib_dir)
+    oracledb = _oracledb()
+    with _THICK_MODE_LOCK:
+        # Thick mode включается один раз на процесс: повторные вызовы не трогают
+        # PATH, файловую систему и клиентскую библиотеку
+        if not oracledb.is_thin_mode():
+            return True
 
-    if lib_dir_str is None and platform.system() == 'Windows':
-        lib_dir_str = _autodetect_windows_instantclient()
+        lib_dir_str = _normalize_lib_dir(lib_dir)
 
-    _ensure_path_contains(lib_dir_str)
-    _verify_oci_presence(lib_dir_str)
+        if lib_dir_str is None and platform.system() == 'Windows':
+            lib_dir_str = _autodetect_windows_instantclient()
 
-    try:
-        oracledb.init_oracle_client(
-            lib_dir=r'D:\instantclient_12_1',
-            config_dir=r'D:\instantclient_12_1',
-        )
-    except Exception as e:
-        raise RuntimeError(f'Failed to init Oracle thick mode: {e}') from e
-    return True
+        _ensure_path_contains(lib_dir_str)
+        _verify_oci_presence(lib_dir_str)
+
+        try:
+            oracledb.init_oracle_client(lib_dir=lib_dir_str, config_dir=lib_dir_str)
+        except Exception as e:
+            raise RuntimeError(f'Failed to init Oracle thick mode: {e}') from e
+        return True
 
 
 def _create_oracle_connection(
@@ -292,8 +364,10 @@ def _create_oracle_connection(
     read_only: bool,
     thick_mode: bool = True,
     lib_dir: _Path | str | None = None,
+    pooled: bool = False,
 ) -> DatabaseConnection:
-    parsed = urlparse(connection_string)
+    oracledb = _oracledb()
+    parsed = _parse_url(connection_string)
     host = parsed.hostname
     if not host:
         raise ValueError('Отсутствует hostname в строке подключения Oracle')
@@ -303,13 +377,23 @@ def _create_oracle_connection(
     if thick_mode:
         # best-effort initialization; errors will propagate if critical
         _ = init_oracle_thick_mode(lib_dir=lib_dir)
-    conn = oracledb.connect(
-        user=parsed.username,
-        password=parsed.password,
-        dsn=dsn,
-        config_dir=False,
-        disable_oob=True,
-    )
+    if pooled:
+        pool = _get_oracle_pool(
+            connection_string,
+            read_only=read_only,
+            user=parsed.username,
+            password=parsed.password,
+            dsn=dsn,
+        )
+        conn = pool.acquire()
+    else:
+        conn = oracledb.connect(
+            user=parsed.username,
+            password=parsed.password,
+            dsn=dsn,
+            config_dir=False,
+            disable_oob=True,
+        )
     if read_only:
         cursor = conn.cursor()
         cursor.execute('SET TRANSACTION READ ONLY')
@@ -318,6 +402,62 @@ def _create_oracle_connection(
     return cast(DatabaseConnection, conn)
 
 
+def _get_oracle_pool(
+    connection_string: ConnectionString,
+    *,
+    read_only: bool,
+    user: str | None,
+    password: str | None,
+    dsn: str,
+) -> oracledb.ConnectionPool:
+    """Возвращает пул сессий для connection string, создавая его при первом вызове.
+
+    Пул создаётся вне блокировки, чтобы медленное подключение к одной БД
+    не задерживало остальные; при гонке лишний пул закрывается.
+    """
+    key = (connection_string, read_only)
+    pool = _ORACLE_POOLS.get(key)
+    if pool is not None:
+        return pool
+
+    oracledb = _oracledb()
+    new_pool = oracledb.create_pool(
+        user=user,
+        password=password,
+        dsn=dsn,
+        min=ORACLE_POOL_MIN,
+        max=ORACLE_POOL_MAX,
+        increment=1,
+        getmode=oracledb.POOL_GETMODE_WAIT,
+        config_dir=False,
+        disable_oob=True,
+    )
+    with _ORACLE_POOLS_LOCK:
+        pool = _ORACLE_POOLS.setdefault(key, new_pool)
+    if pool is not new_pool:
+        with suppress(Exception):
+            new_pool.close(force=True)
+    return pool
+
+
+def close_pools() -> None:
+    """
+    Закрывает все пулы сессий Oracle.
+
+    Вызывается автоматически при завершении процесса; после вызова
+    следующий pooled-запрос создаст пул заново.
+    """
+    with _ORACLE_POOLS_LOCK:
+        pools = list(_ORACLE_POOLS.values())
+        _ORACLE_POOLS.clear()
+    for pool in pools:
+        with suppress(Exception):
+            pool.close(force=True)
+
+
+atexit.register(close_pools)
+
+
 def _create_postgresql_connection(
     connection_string: ConnectionString,
     *,
@@ -326,7 +466,7 @@ def _create_postgresql_connection(
 ) -> DatabaseConnection:
     """Создает подключение к PostgreSQL БД."""
     options = f'-c default_transaction_read_only={"on" if read_only else "off"}'
-    conn = psycopg.connect(
+    conn = _psycopg().connect(
         connection_string,
         autocommit=False,
         connect_timeout=timeout,
@@ -335,14 +475,29 @@ def _create_postgresql_connection(
     return cast(DatabaseConnection, conn)
 
 
-def _resolve_sqlite_path(conn_str: str) -> tuple[str, bool]:
-    """Определяет путь к SQLite БД из connection string."""
-    parsed = urlparse(conn_str)
+@lru_cache(maxsize=_URL_CACHE_SIZE)
+def _parse_sqlite_path(conn_str: str) -> tuple[str, bool]:
+    """Выделяет путь к SQLite БД из connection string и признак URI-режима.
+
+    Чистое строковое преобразование, поэтому кешируется; состояние файловой
+    системы здесь не учитывается.
+    """
+    parsed = _parse_url(conn_str)
     db_path_local = conn_str
     if parsed.scheme and parsed.scheme.startswith('sqlite'):
         db_path_local = parsed.path.lstrip('/') or parsed.netloc or db_path_local
 
     use_uri_local = db_path_local.startswith('file:') or '://' in conn_str
+    return db_path_local, use_uri_local
+
+
+def _resolve_sqlite_path(conn_str: str) -> tuple[str, bool]:
+    """Определяет путь к SQLite БД из connection string.
+
+    Существование файлов проверяется при каждом вызове: файл в текущей
+    директории мог появиться после предыдущего подключения.
+    """
+    db_path_local, use_uri_local = _parse_sqlite_path(conn_str)
 
     if use_uri_local:
         return db_path_local, use_uri_local
@@ -355,14 +510,12 @@ def _resolve_sqlite_path(conn_str: str) -> tuple[str, bool]:
     if cand.exists():
         return str(cand), use_uri_local
 
-    module_dir = _Path(__file__).resolve().parent
-    cand2 = module_dir / p
+    cand2 = _MODULE_DIR / p
     if cand2.exists():
         return str(cand2), use_uri_local
 
-    parent = cand2.parent
     with suppress(Exception):
-        parent.mkdir(parents=True, exist_ok=True)
+        cand2.parent.mkdir(parents=True, exist_ok=True)
     return str(cand2), use_uri_local
 
 
@@ -370,6 +523,7 @@ def _create_sqlite_connection(
     connection_string: ConnectionString,
     *,
     timeout: int,
+    pragmas: Mapping[str, str | int] | None = None,
 ) -> DatabaseConnection:
     """Создает подключение к SQLite БД."""
     db_path, use_uri = _resolve_sqlite_path(connection_string)
@@ -381,9 +535,69 @@ def _create_sqlite_connection(
     else:
         conn = sqlite3.connect(db_path, timeout=timeout)
 
+    if pragmas:
+        conn.executescript(''.join(f'PRAGMA {name}={value};' for name, value in pragmas.items()))
+
     return cast(DatabaseConnection, conn)
 
 
+# Адаптеры create_connection: принимают общий набор параметров и передают
+# конкретному драйверу только нужные ему
+def _connect_oracle(
+    connection_string: ConnectionString,
+    *,
+    read_only: bool,
+    lib_dir: str | None,
+    pooled: bool,
+    **_: object,
+) -> DatabaseConnection:
+    return _create_oracle_connection(
+        connection_string,
+        read_only=read_only,
+        thick_mode=True,
+        lib_dir=lib_dir or _DEFAULT_ORACLE_LIB_DIR,
+        pooled=pooled,
+    )
+
+
+def _connect_postgresql(
+    connection_string: ConnectionString,
+    *,
+    read_only: bool,
+    timeout: int,
+    **_: object,
+) -> DatabaseConnection:
+    return _create_postgresql_connection(
+        connection_string,
+        read_only=read_only,
+        timeout=timeout,
+    )
+
+
+def _connect_sqlite(
+    connection_string: ConnectionString,
+    *,
+    timeout: int,
+    sqlite_pragmas: Mapping[str, str | int] | None,
+    **_: object,
+) -> DatabaseConnection:
+    return _create_sqlite_connection(
+        connection_string,
+        timeout=timeout,
+        pragmas=sqlite_pragmas,
+    )
+
+
+# Выбор драйвера по типу БД (включая псевдонимы) — одна выборка из словаря
+_CONNECTORS: Final[Mapping[str, Callable[..., DatabaseConnection]]] = MappingProxyType({
+    'oracle': _connect_oracle,
+    'postgresql': _connect_postgresql,
+    'postgres': _connect_postgresql,
+    'sqlite': _connect_sqlite,
+    'sqlite3': _connect_sqlite,
+})
+
+
 def close_connection(
     connection: DatabaseConnection | None,
 ) -> None:
@@ -405,7 +619,77 @@ def close_connection(
         connection.close()
 
 
-@contextmanager
+class _ConnectionContext(AbstractContextManager[DatabaseConnection]):
+    """Контекст подключения: создаёт его на входе, откатывает при ошибке и закрывает."""
+
+    __slots__ = (
+        '_connection',
+        '_connection_string',
+        '_db_type',
+        '_lib_dir',
+        '_pooled',
+        '_read_only',
+        '_sqlite_pragmas',
+        '_timeout',
+    )
+
+    def __init__(
+        self,
+        connection_string: ConnectionString,
+        db_type: DBType | None,
+        *,
+        read_only: bool,
+        timeout: int,
+        lib_dir: str | None,
+        pooled: bool,
+        sqlite_pragmas: Mapping[str, str | int] | None,
+    ) -> None:
+        self._connection_string = connection_string
+        self._db_type = db_type
+        self._read_only = read_only
+        self._timeout = timeout
+        self._lib_dir = lib_dir
+        self._pooled = pooled
+        self._sqlite_pragmas = sqlite_pragmas
+        self._connection: DatabaseConnection | None = None
+
+    def __enter__(self) -> DatabaseConnection:
+        try:
+            self._connection = create_connection(
+                self._connection_string,
+                self._db_type,
+                read_only=self._read_only,
+                timeout=self._timeout,
+                lib_dir=self._lib_dir,
+                pooled=self._pooled,
+                sqlite_pragmas=self._sqlite_pragmas,
+            )
+        except Exception as e:
+            _LOG.warning('Ошибка в context manager: %s', e)
+            _LOG.debug('Context manager: подключение закрыто')
+            raise
+        _LOG.debug('Context manager: подключение создано')
+        return self._connection
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        connection, self._connection = self._connection, None
+        if isinstance(exc, Exception):
+            _LOG.warning('Ошибка в context manager: %s', exc)
+            if connection is not None:
+                try:
+                    connection.rollback()
+                    _LOG.debug('Выполнен rollback транзакции')
+                except Exception:  # noqa: S110
+                    pass
+        close_connection(connection)
+        _LOG.debug('Context manager: подключение закрыто')
+
+
 def get_connection(
     connection_string: ConnectionString,
     db_type: DBType | None = None,
@@ -413,49 +697,70 @@ def get_connection(
     read_only: bool = False,
     timeout: int = 30,
     lib_dir: str | None = None,
-) -> Generator[DatabaseConnection]:
+    pooled: bool = False,
+    sqlite_pragmas: Mapping[str, str | int] | None = None,
+) -> AbstractContextManager[DatabaseConnection]:
     """
     Context manager для работы с подключением к БД.
 
+    Транзакция не фиксируется автоматически: для сохранения изменений вызовите
+    ``conn.commit()`` внутри блока. При исключении выполняется rollback
+    и исключение пробрасывается дальше; подключение закрывается в обоих случаях.
+
     Args:
         connection_string: Строка подключения к БД.
         db_type: Тип БД (опционально).
         read_only: Создать read-only подключение.
         timeout: Таймаут подключения.
+        pooled: Брать сессию Oracle из пула; при выходе она возвращается в пул.
+        sqlite_pragmas: PRAGMA для нового SQLite-подключения (например SQLITE_WAL_PRAGMAS).
 
-    Yields:
-        Объект подключения к БД.
+    Returns:
+        Context manager, который на входе отдаёт объект подключения к БД.
 
     Examples:
         >>> with get_connection('sqlite:///test.db') as conn:
         ...     cursor = conn.cursor()
         ...     cursor.execute('SELECT 1')
     """
-    logger = get_logger('database')
+    return _ConnectionContext(
+        connection_string,
+        db_type,
+        read_only=read_only,
+        timeout=timeout,
+        lib_dir=lib_dir,
+        pooled=pooled,
+        sqlite_pragmas=sqlite_pragmas,
+    )
 
-    connection = None
-    try:
-        connection = create_connection(
-            connection_string,
-            db_type,
-            read_only=read_only,
-            timeout=timeout,
-            lib_dir=lib_dir,
-        )
-        logger.debug('Context manager: подключение создано')
-        yield connection
-    except Exception as e:
-        logger.warning('Ошибка в context manager: %s', e)
-        if connection:
-            try:
-                connection.rollback()
-                logger.debug('Выполнен rollback транзакции')
-            except Exception:  # noqa: S110
-                pass
-        raise
-    finally:
-        close_connection(connection)
-        logger.debug('Context manager: подключение закрыто')
+
+# Сведения о БД одним запросом на СУБД: один round-trip вместо двух-трёх
+_ORACLE_INFO_QUERY: Final[str] = (
+    'SELECT (SELECT banner FROM v$version'
+    " WHERE banner LIKE 'Oracle%' AND ROWNUM = 1),"
+    " SYS_CONTEXT('USERENV', 'DB_NAME'), USER FROM DUAL"
+)
+_POSTGRES_INFO_QUERY: Final[str] = 'SELECT version(), current_database(), CURRENT_USER'
+_SQLITE_INFO_QUERY: Final[str] = (
+    "SELECT sqlite_version(), (SELECT name FROM pragma_database_list WHERE name = 'main')"
+)
+_INFO_KEYS: Final[tuple[str, ...]] = ('version', 'database', 'user')
+
+
+def _query_info(
+    cursor,
+    query: str,
+    keys: tuple[str, ...] = _INFO_KEYS,
+) -> dict[
+    str,
+    str | int,
+]:
+    """Выполняет запрос сведений о БД и сопоставляет столбцы строки с ключами."""
+    cursor.execute(query)
+    row = cursor.fetchone()
+    if not row:
+        return {}
+    return {key: value for key, value in zip(keys, row, strict=True) if value is not None}
 
 
 def oracle_info(
@@ -467,8 +772,8 @@ def oracle_info(
     """
     Retrieves information about an Oracle database connection.
 
-    This function executes SQL queries against an Oracle database to gather
-    version and database name information.
+    This function executes a single SQL query against an Oracle database to gather
+    version, database name and user information.
 
     Args:
         cursor: An Oracle database cursor object that implements the DBCursor protocol.
@@ -478,21 +783,9 @@ def oracle_info(
         A dictionary containing information about the Oracle database:
         - 'version': The Oracle database version string
         - 'database': The name of the connected Oracle database
+        - 'user': The current database user
     """
-    info = {}
-    cursor.execute("SELECT * FROM v$version WHERE banner LIKE 'Oracle%'")
-    result = cursor.fetchone()
-    if result:
-        info['version'] = result[0]
-    cursor.execute("SELECT SYS_CONTEXT('USERENV', 'DB_NAME') FROM DUAL")
-    result = cursor.fetchone()
-    if result:
-        info['database'] = result[0]
-    cursor.execute("SELECT USER FROM dual")
-    result = cursor.fetchone()
-    if result:
-        info['user'] = result[0]
-    return info
+    return _query_info(cursor, _ORACLE_INFO_QUERY)
 
 
 def postgres_info(
@@ -504,8 +797,8 @@ def postgres_info(
     """
     Retrieves information about a PostgreSQL database connection.
 
-    This function executes SQL queries against a PostgreSQL database to gather
-    version and database name information.
+    This function executes a single SQL query against a PostgreSQL database to gather
+    version, database name and user information.
 
     Args:
         cursor: A PostgreSQL database cursor object that implements the DBCursor protocol.
@@ -515,21 +808,9 @@ def postgres_info(
         A dictionary containing information about the PostgreSQL database:
         - 'version': The PostgreSQL database version string
         - 'database': The name of the connected PostgreSQL database
+        - 'user': The current database user
     """
-    info = {}
-    cursor.execute('SELECT version()')
-    result = cursor.fetchone()
-    if result:
-        info['version'] = result[0]
-    cursor.execute('SELECT current_database()')
-    result = cursor.fetchone()
-    if result:
-        info['database'] = result[0]
-    cursor.execute('SELECT CURRENT_USER')
-    if result:
-        info['user'] = result[0]
-
-    return info
+    return _query_info(cursor, _POSTGRES_INFO_QUERY)
 
 
 def sqlite_info(
@@ -539,30 +820,31 @@ def sqlite_info(
     str | int,
 ]:
     """
-    Retrieves information about a PostgreSQL database connection.
+    Retrieves information about a SQLite database connection.
 
-    This function executes SQL queries against a PostgreSQL database to gather
+    This function executes a single SQL query against a SQLite database to gather
     version and database name information.
 
     Args:
-        cursor: A PostgreSQL database cursor object that implements the DBCursor protocol.
+        cursor: A SQLite database cursor object that implements the DBCursor protocol.
                Used to execute queries against the database.
 
     Returns:
-        A dictionary containing information about the PostgreSQL database:
-        - 'version': The PostgreSQL database version string
-        - 'database': The name of the connected PostgreSQL database
+        A dictionary containing information about the SQLite database:
+        - 'version': The SQLite library version string
+        - 'database': The name of the main database
     """
-    info = {}
-    cursor.execute('SELECT sqlite_version()')
-    result = cursor.fetchone()
-    if result:
-        info['version'] = result[0]
-    cursor.execute('SELECT name FROM pragma_database_list WHERE name="main"')
-    result = cursor.fetchone()
-    if result:
-        info['database'] = result[0]
-    return info
+    return _query_info(cursor, _SQLITE_INFO_QUERY, ('version', 'database'))
+
+
+# Функции сбора сведений по типу БД (включая псевдонимы)
+_INFO_FUNCS: Final[Mapping[str, Callable[..., dict[str, str | int]]]] = MappingProxyType({
+    'oracle': oracle_info,
+    'postgresql': postgres_info,
+    'postgres': postgres_info,
+    'sqlite': sqlite_info,
+    'sqlite3': sqlite_info,
+})
 
 
 def get_db_info(
@@ -582,26 +864,18 @@ def get_db_info(
     Returns:
         Словарь с информацией о БД (version, database, db_type).
     """
-    logger = get_logger('database')
     info: dict[str, str | int] = {'db_type': db_type}
-    info_funcs = {
-        'oracle': oracle_info,
-        'postgresql': postgres_info,
-        'postgres': postgres_info,
-        'sqlite': sqlite_info,
-        'sqlite3': sqlite_info,
-    }
+    info_func = _INFO_FUNCS.get(db_type)
 
     cursor = connection.cursor()
     try:
-        if db_type in info_funcs:
-            print("db_type=", db_type)
-            info.update(info_funcs[db_type](cursor))
+        if info_func is not None:
+            info.update(info_func(cursor))
         else:
-            logger.warning('Unsupported database type: %s', db_type)
-        logger.debug('Получена информация о БД: %s', info)
+            _LOG.warning('Unsupported database type: %s', db_type)
+        _LOG.debug('Получена информация о БД: %s', info)
     except Exception as e:
-        logger.warning('Не удалось получить информацию о БД: %s', e)
+        _LOG.warning('Не удалось получить информацию о БД: %s', e)
     finally:
         cursor.close()
     return info
@@ -671,7 +945,7 @@ def try_parse_url(connection_string: str) -> tuple[bool, object | str]:
         (False, сообщение об ошибке) иначе.
     """
     try:
-        return True, urlparse(connection_string)
+        return True, _parse_url(connection_string)
     except Exception as e:
         return False, f'Ошибка при валидации: {e}'
 
@@ -3,15 +3,21 @@
 from __future__ import annotations
 
 import logging
+import os
+import stat
 import sys
+import threading
+from collections.abc import Callable, Iterator, Mapping
+from functools import cache
 from pathlib import Path
-from typing import Final, TypedDict, cast
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Final, TypedDict, cast
 
-from dotenv import load_dotenv
 from pydantic import Field, ValidationError, ValidationInfo, field_validator, model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from sqlalchemy.engine.url import make_url
-from sqlalchemy.exc import ArgumentError
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine.url import URL
 
 try:
     # Предпочтительно использовать свой логгер — если доступен
@@ -21,6 +27,11 @@ try:
 except Exception:
     LOGGER_AVAILABLE = False
 
+# Логгер модуля получаем один раз при импорте, а не на каждой ошибке
+_LOG: Final[logging.Logger] = (
+    get_logger('config') if LOGGER_AVAILABLE else logging.getLogger('oracle_exporter.config')
+)
+
 VALID_DB_TYPES: Final[frozenset[str]] = frozenset((
     'oracle',
     'postgres',
@@ -28,6 +39,10 @@ VALID_DB_TYPES: Final[frozenset[str]] = frozenset((
     'sqlite',
     'sqlite3',
 ))
+_VALID_DB_TYPES_STR: Final[str] = ', '.join(sorted(VALID_DB_TYPES))
+
+# Предел строк на листе Excel (формат .xlsx)
+EXCEL_MAX_ROWS: Final[int] = 1_048_576
 
 
 class ConfigDict(TypedDict):
@@ -49,8 +64,9 @@ class ConfigDict(TypedDict):
     PROGRESS_UPDATE_INTERVAL: int
 
 
-# Mapping[str, int | str | bool] = {
-DEFAULT_CONFIG: ConfigDict = {
+# Значения по умолчанию; MappingProxyType защищает их от изменения во время выполнения
+# (схема ключей и типов — ConfigDict)
+DEFAULT_CONFIG: Final[Mapping[str, str | int | bool]] = MappingProxyType({
     'LOG_LEVEL': 'INFO',
     'OUTPUT_DIR': './exports',
     'LOG_FILE': './logs/oracle_export.log',
@@ -65,7 +81,23 @@ DEFAULT_CONFIG: ConfigDict = {
     'BATCH_SIZE': 50_000,
     'SHOW_PROGRESS_BAR': True,
     'PROGRESS_UPDATE_INTERVAL': 100,
-}
+})
+
+# Допустимые схемы SQLAlchemy URL для каждого нормализованного типа БД
+_ALLOWED_SCHEMES: Final[Mapping[str, tuple[str, ...]]] = MappingProxyType({
+    'oracle': ('oracle', 'oracle+cx_oracle', 'oracle+oracledb'),
+    'postgresql': (
+        'postgresql',
+        'postgresql+psycopg2',
+        'postgresql+psycopg',
+        'postgresql+psycopg3',
+    ),
+})
+
+# Значения по умолчанию с ключами по именам полей Settings — для before-валидаторов
+_FIELD_DEFAULTS: Final[Mapping[str, str | int | bool]] = MappingProxyType({
+    key.lower(): value for key, value in DEFAULT_CONFIG.items()
+})
 
 
 class Settings(BaseSettings):
@@ -101,22 +133,26 @@ class Settings(BaseSettings):
     fetch_array_size: int = Field(
         default=cast(int, DEFAULT_CONFIG['FETCH_ARRAY_SIZE']),
         ge=1,
+        le=10_000,
         description='Размер массива для fetchmany()',
     )
     chunk_size: int = Field(
         default=cast(int, DEFAULT_CONFIG['CHUNK_SIZE']),
         ge=1,
+        le=100_000,
         description='Размер чанка для обработки',
     )
     query_timeout: int = Field(
         default=cast(int, DEFAULT_CONFIG['QUERY_TIMEOUT']),
         ge=0,
+        le=3600,
         description='Таймаут запроса (секунды)',
     )
 
     max_column_width: int = Field(
         default=cast(int, DEFAULT_CONFIG['MAX_COLUMN_WIDTH']),
         ge=1,
+        le=200,
         description='Макс. ширина колонки',
     )
     null_value_replacement: str = Field(
@@ -130,6 +166,7 @@ class Settings(BaseSettings):
     max_rows_per_sheet: int = Field(
         default=cast(int, DEFAULT_CONFIG['MAX_ROWS_PER_SHEET']),
         ge=1,
+        le=EXCEL_MAX_ROWS,
         description='Макс. строк на лист',
     )
 
@@ -183,8 +220,7 @@ class Settings(BaseSettings):
     def parse_empty_int(cls, v: str | int | None, info: ValidationInfo) -> int | str | None:
         """Преобразует пустые строки в дефолтные значения для int полей."""
         if v == '' or v is None:
-            field_name = info.field_name or ''
-            default_value = DEFAULT_CONFIG.get(field_name.upper())
+            default_value = _FIELD_DEFAULTS.get(info.field_name or '')
             return default_value if default_value is not None else v
         return v
 
@@ -198,8 +234,7 @@ class Settings(BaseSettings):
     def parse_empty_bool(cls, v: object, info: ValidationInfo) -> object:
         """Преобразует пустые строки и строковые bool в дефолтные значения."""
         if v == '' or v is None:
-            field_name = info.field_name or ''
-            default_value = DEFAULT_CONFIG.get(field_name.upper())
+            default_value = _FIELD_DEFAULTS.get(info.field_name or '')
             return default_value if default_value is not None else v
         if isinstance(v, str):
             lower_v = v.lower().strip()
@@ -214,8 +249,7 @@ class Settings(BaseSettings):
     def parse_empty_str(cls, v: object, info: ValidationInfo) -> object:
         """Преобразует пустые строки в дефолтные значения для str полей."""
         if v == '' or v is None:
-            field_name = info.field_name or ''
-            default_value = DEFAULT_CONFIG.get(field_name.upper())
+            default_value = _FIELD_DEFAULTS.get(info.field_name or '')
             return default_value if default_value is not None else ''
         return v
 
@@ -223,96 +257,93 @@ class Settings(BaseSettings):
     @classmethod
     def normalize_db_type(cls, v: str) -> str:
         """Нормализует и валидирует db_type."""
-        if not v or v == '':
+        if not v:
             raise ValueError('DB_TYPE не может быть пустым')
         normalized = v.strip().lower()
         if normalized not in VALID_DB_TYPES:
-            valid_types = ', '.join(sorted(VALID_DB_TYPES))
-            raise ValueError(f"Недопустимый DB_TYPE='{v}'. Допустимые значения: {valid_types}")
+            raise ValueError(
+                f"Недопустимый DB_TYPE='{v}'. Допустимые значения: {_VALID_DB_TYPES_STR}"
+            )
         if normalized in ('postgres', 'postgresql'):
             return 'postgresql'
         if normalized in ('sqlite', 'sqlite3'):
             return 'sqlite'
         return normalized
 
+    @field_validator('log_level')
+    @classmethod
+    def normalize_log_level(cls, v: str) -> str:
+        """Приводит уровень логирования к верхнему регистру один раз при загрузке."""
+        return v.strip().upper()
+
     @field_validator('db_connect_uri')
     @classmethod
     def validate_db_connect_uri(cls, v: str, info: ValidationInfo) -> str:
         """Валидирует строку подключения к БД с помощью SQLAlchemy make_url."""
-        if not v or v.strip() == '':
-            raise ValueError('DB_CONNECT_URI не может быть пустым')
         uri = v.strip()
-        masked_uri = cls.mask_connection_string(uri)
+        if not uri:
+            raise ValueError('DB_CONNECT_URI не может быть пустым')
 
-        db_type = info.data.get('db_type', '').lower()
+        # db_type уже приведён к канонической форме валидатором normalize_db_type
+        db_type = info.data.get('db_type')
         if not db_type:
             return uri
-        db_type = cls._normalize_db_type_for_validation(db_type)
 
         # SQLite has special handling
         if db_type == 'sqlite':
             if not uri.startswith('sqlite:'):
+                masked_uri = cls.mask_connection_string(uri)
                 raise ValueError(f'Для SQLite URI должен начинаться с "sqlite:": {masked_uri}')
             return uri
 
         # Parse URL for other databases
-        cls._validate_url_format(uri, db_type, masked_uri)
+        cls._validate_url_format(uri, db_type)
         return uri
 
     @staticmethod
-    def _validate_url_format(uri: str, db_type: str, masked_uri: str) -> None:
-        """Валидирует формат URL для Oracle и PostgreSQL."""
+    def _validate_url_format(uri: str, db_type: str) -> None:
+        """Валидирует формат URL для Oracle и PostgreSQL.
+
+        Маскированный URI строится только для сообщений об ошибках.
+        """
+        make_url, argument_error = _sqlalchemy_url_api()
         try:
             url_obj = make_url(uri)
-        except ArgumentError:
+        except argument_error:
             error_msg = (
                 f'Некорректный URI для {db_type.upper()}: некорректный формат URL\n'
-                f'URI: {masked_uri}'
+                f'URI: {Settings.mask_connection_string(uri)}'
             )
             raise ValueError(error_msg) from None
 
-        Settings._check_scheme_allowed(url_obj.drivername, db_type, masked_uri)
-        Settings._check_host_and_port(url_obj, db_type, masked_uri)
+        Settings._check_scheme_allowed(url_obj.drivername, db_type, uri)
+        Settings._check_host_and_port(url_obj, db_type, uri)
         if db_type == 'postgresql' and not url_obj.database:
+            masked_uri = Settings.mask_connection_string(uri)
             raise ValueError(f'PostgreSQL URI не содержит имя базы данных: {masked_uri}')
 
     @staticmethod
-    def _check_host_and_port(url_obj: object, db_type: str, masked_uri: str) -> None:
+    def _check_host_and_port(url_obj: object, db_type: str, uri: str) -> None:
         """Проверяет наличие hostname и port в URL."""
         if not getattr(url_obj, 'host', None):
-            raise ValueError(f'URI не содержит hostname: {masked_uri}')
+            raise ValueError(f'URI не содержит hostname: {Settings.mask_connection_string(uri)}')
         if getattr(url_obj, 'port', None) is None:
             default_port = 1521 if db_type == 'oracle' else 5432
             raise ValueError(
                 f'URI не содержит порт. Укажите порт явно (стандартный для '
-                f'{db_type.upper()}: {default_port}). URI: {masked_uri}'
+                f'{db_type.upper()}: {default_port}). '
+                f'URI: {Settings.mask_connection_string(uri)}'
             )
 
     @staticmethod
-    def _normalize_db_type_for_validation(db_type: str) -> str:
-        if db_type in ('postgres', 'postgresql'):
-            return 'postgresql'
-        if db_type in ('sqlite', 'sqlite3'):
-            return 'sqlite'
-        return db_type
-
-    @staticmethod
-    def _check_scheme_allowed(drivername: str, db_type: str, masked_uri: str) -> None:
-        if db_type == 'oracle':
-            allowed = ('oracle', 'oracle+cx_oracle', 'oracle+oracledb')
-        elif db_type == 'postgresql':
-            allowed = (
-                'postgresql',
-                'postgresql+psycopg2',
-                'postgresql+psycopg',
-                'postgresql+psycopg3',
-            )
-        else:
+    def _check_scheme_allowed(drivername: str, db_type: str, uri: str) -> None:
+        allowed = _ALLOWED_SCHEMES.get(db_type)
+        if allowed is None:
             return
         if drivername not in allowed:
             msg = (
                 f'Неверная схема для {db_type.title()} URI: {drivername!r}. '
-                f'Ожидается одно из {allowed}. URI: {masked_uri}'
+                f'Ожидается одно из {allowed}. URI: {Settings.mask_connection_string(uri)}'
             )
             raise ValueError(msg)
 
@@ -392,41 +423,167 @@ def _get_uri_separator(uri: str) -> str | None:
     return None
 
 
-def load_config(env_file: str = '.env') -> Settings:
-    """Загружает конфигурацию из .env файла."""
-    env_path = Path(env_file)
-    if not env_path.exists():
-        error_msg = f'Файл конфигурации не найден: {env_path.absolute()}'
-        logger = get_logger('config') if LOGGER_AVAILABLE else logging.getLogger('config')
-        logger.error(error_msg)
-        raise FileNotFoundError(error_msg)
+@cache
+def _sqlalchemy_url_api() -> tuple[Callable[[str], URL], type[Exception]]:
+    """Возвращает make_url и ArgumentError, импортируя SQLAlchemy один раз.
+
+    SQLAlchemy не импортируется на уровне модуля: это основная часть
+    времени импорта, а для SQLite он не нужен.
+    """
+    from sqlalchemy.engine.url import make_url  # noqa: PLC0415
+    from sqlalchemy.exc import ArgumentError  # noqa: PLC0415
+
+    return make_url, ArgumentError
+
+
+def _settings_env_names() -> frozenset[str]:
+    """Имена переменных окружения (в нижнем регистре), которые читает Settings."""
+    prefix = Settings.model_config.get('env_prefix', '')
+    names: set[str] = set()
+    for name, field in Settings.model_fields.items():
+        names.add(name)
+        for alias in (field.alias, field.validation_alias):
+            if isinstance(alias, str):
+                names.add(alias)
+    return frozenset(f'{prefix}{name}'.lower() for name in names)
+
+
+# Переменные окружения, влияющие на Settings: входят в ключ кеша load_config
+_SETTINGS_ENV_NAMES: Final[frozenset[str]] = _settings_env_names()
+
+# Отпечаток состояния, от которого зависит результат: (st_mtime_ns, st_size,
+# снимок переменных окружения)
+_ConfigFingerprint = tuple[int, int, tuple[tuple[str, str], ...]]
+
+# Кеш загруженных конфигураций: абсолютный путь -> (отпечаток, Settings).
+# На путь хранится только последняя версия, чтобы устаревшие Settings
+# (с паролями в строке подключения) не накапливались в памяти
+_CONFIG_CACHE: dict[str, tuple[_ConfigFingerprint, Settings]] = {}
+# Сериализует промахи кеша и его очистку: один и тот же файл не разбирается
+# параллельно несколькими потоками
+_CONFIG_CACHE_LOCK: Final[threading.Lock] = threading.Lock()
+
+
+def _settings_environ_snapshot() -> tuple[tuple[str, str], ...]:
+    """Снимок переменных окружения, которые читает Settings.
+
+    Переменные окружения имеют приоритет над .env, поэтому без них в ключе
+    кеш вернул бы устаревшую конфигурацию после изменения окружения.
+    """
+    return tuple(sorted(
+        (key.lower(), value)
+        for key, value in os.environ.items()
+        if key.lower() in _SETTINGS_ENV_NAMES
+    ))
+
+
+def clear_config_cache() -> None:
+    """Сбрасывает кеш load_config."""
+    with _CONFIG_CACHE_LOCK:
+        _CONFIG_CACHE.clear()
+
+
+def _stat_config_file(env_path: Path) -> os.stat_result:
+    """Проверяет, что .env существует и является обычным файлом; возвращает его stat."""
+    # Один stat() вместо exists() + stat(): отсутствие файла ловим по исключению
     try:
-        # Use python-dotenv to load variables from specified file
-        load_dotenv(env_path)
-        return Settings()  # type: ignore[call-arg]
-    except ValidationError as e:
-        full_error_msg = _format_validation_error(e)
-        raise ValueError(full_error_msg) from e
+        st = env_path.stat()
+    except FileNotFoundError:
+        error_msg = f'Файл конфигурации не найден: {env_path}'
+        _LOG.error(error_msg)
+        raise FileNotFoundError(error_msg) from None
+    except OSError as e:
+        # Нет прав, путь через файл и т.п.: отдаём обычную ошибку конфигурации
+        error_msg = f'Файл конфигурации недоступен: {env_path} ({e.strerror})'
+        _LOG.error(error_msg)
+        raise ValueError(error_msg) from e
+    # pydantic-settings молча пропускает не-файлы, и ошибка всплыла бы
+    # как «поле обязательно»; проверяем по уже полученному stat
+    if not stat.S_ISREG(st.st_mode):
+        error_msg = f'Путь к конфигурации не является файлом: {env_path}'
+        _LOG.error(error_msg)
+        raise ValueError(error_msg)
+    return st
 
 
-def _format_validation_error(e: ValidationError) -> str:
-    error_messages = []
-    for error in e.errors():
+def load_config(env_file: str = '.env') -> Settings:
+    """Загружает конфигурацию из .env файла.
+
+    Результат кешируется по абсолютному пути с отпечатком (mtime, размер
+    файла и снимок переменных окружения, которые читает Settings): повторный
+    вызов с неизменёнными .env и окружением стоит одного ``stat`` и копии
+    модели. Для каждого пути хранится только последняя загрузка.
+    Для сброса кеша: ``clear_config_cache()``.
+    """
+    env_path = Path(env_file).absolute()
+    st = _stat_config_file(env_path)
+
+    cache_path = str(env_path)
+    fingerprint = (st.st_mtime_ns, st.st_size, _settings_environ_snapshot())
+    cached = _CONFIG_CACHE.get(cache_path)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1].model_copy()
+
+    with _CONFIG_CACHE_LOCK:
+        # Повторная проверка: файл мог загрузить другой поток, пока мы ждали
+        cached = _CONFIG_CACHE.get(cache_path)
+        if cached is not None and cached[0] == fingerprint:
+            return cached[1].model_copy()
+        try:
+            # Файл читает сам pydantic-settings: os.environ не изменяется,
+            # а переменные окружения по-прежнему имеют приоритет над .env
+            config = Settings(_env_file=env_path)  # type: ignore[call-arg]
+        except ValidationError as e:
+            full_error_msg = _format_validation_error(e)
+            raise ValueError(full_error_msg) from e
+        _CONFIG_CACHE[cache_path] = (fingerprint, config)
+    return config.model_copy()
+
+
+def _iter_validation_errors(e: ValidationError) -> Iterator[str]:
+    """Построчно форматирует ошибки pydantic (без ссылок на документацию)."""
+    for error in e.errors(include_url=False):
         field = ' -> '.join(str(loc) for loc in error['loc'])
-        msg = error['msg']
-        error_messages.append(f' • {field}: {msg}')
-    formatted_errors = '\n'.join(error_messages)
+        yield f' • {field}: {error["msg"]}'
+
+
+def _format_validation_error(e: ValidationError) -> str:
+    formatted_errors = '\n'.join(_iter_validation_errors(e))
     full_error_msg = f'Ошибка валидации конфигурации:\n{formatted_errors}'
-    if LOGGER_AVAILABLE:
-        try:
-            logger = get_logger('oracle_exporter.config')
-            logger.error(full_error_msg)
-        except Exception:
-            # чтобы в логи не выводился traceback c открытым паролем
-            logging.getLogger('oracle_exporter.config').error('Failed to log validation error')  # noqa: TRY400
+    try:
+        _LOG.error(full_error_msg)
+    except Exception:
+        # чтобы в логи не выводился traceback c открытым паролем
+        _LOG.error('Failed to log validation error')
     return full_error_msg
 
 
+_SUMMARY_TITLE: Final[str] = 'КОНФИГУРАЦИЯ ПРИЛОЖЕНИЯ'
+_SUMMARY_RULE: Final[str] = '=' * 60
+_SECTION_RULE: Final[str] = '-' * 40
+
+# Разделы сводки конфигурации: (заголовок, поля Settings)
+_SUMMARY_SECTIONS: Final[tuple[tuple[str, tuple[str, ...]], ...]] = (
+    ('База данных', ('db_type', 'db_connect_uri', 'lib_dir')),
+    ('Логирование', ('log_level', 'log_file')),
+    ('Экспорт', ('output_dir',)),
+    ('Производительность', ('fetch_array_size', 'chunk_size', 'query_timeout')),
+    (
+        'Excel',
+        ('max_column_width', 'max_rows_per_sheet', 'wrap_long_text', 'null_value_replacement'),
+    ),
+    (
+        'Батч обработка',
+        (
+            'enable_batch_processing',
+            'batch_size',
+            'show_progress_bar',
+            'progress_update_interval',
+        ),
+    ),
+)
+
+
 def print_config_summary(
     config: Settings,
     *,
@@ -434,84 +591,49 @@ def print_config_summary(
     logger: logging.Logger | None = None,
 ) -> None:
     """Выводит сводку конфигурации с маскировкой чувствительных данных."""
+    if logger and not logger.isEnabledFor(logging.INFO):
+        # Запись всё равно будет отброшена — не строим dump и текст сводки
+        return
     masked = config.model_dump_masked() if mask_sensitive else config.model_dump()
-    sections = [
-        ('База данных', ['db_type', 'db_connect_uri', 'lib_dir']),
-        ('Логирование', ['log_level', 'log_file']),
-        ('Экспорт', ['output_dir']),
-        ('Производительность', ['fetch_array_size', 'chunk_size', 'query_timeout']),
-        (
-            'Excel',
-            ['max_column_width', 'max_rows_per_sheet', 'wrap_long_text', 'null_value_replacement'],
-        ),
-        (
-            'Батч обработка',
-            [
-                'enable_batch_processing',
-                'batch_size',
-                'show_progress_bar',
-                'progress_update_interval',
-            ],
-        ),
-    ]
     if logger:
-        _log_config_header(logger)
-        for section_name, params in sections:
-            _log_config_section(section_name, params, masked, logger)
-        _log_config_footer(logger)
+        _log_config_summary(masked, logger)
     else:
-        _print_config_to_console(sections, masked)
+        _print_config_to_console(masked)
 
 
-def _log_config_header(logger: logging.Logger) -> None:
-    logger.info('=' * 60)
-    logger.info('КОНФИГУРАЦИЯ ПРИЛОЖЕНИЯ')
-    logger.info('=' * 60)
+def _format_config_sections(config_data: dict[str, object]) -> str:
+    """Форматирует разделы сводки в один текстовый блок."""
+    lines: list[str] = []
+    for section_name, params in _SUMMARY_SECTIONS:
+        lines.extend(('', f'[{section_name}]', _SECTION_RULE))
+        lines.extend(
+            f' {param.replace("_", " ").title():28}: {config_data[param]}'
+            for param in params
+            if config_data.get(param) is not None
+        )
+    return '\n'.join(lines)
 
 
-def _log_config_section(
-    section_name: str,
-    params: list[str],
+def _log_config_summary(
     config_data: dict[str, object],
     logger: logging.Logger,
 ) -> None:
-    logger.info('')
-    logger.info('[%s]', section_name)
-    logger.info('-' * 40)
-    for param in params:
-        value = config_data.get(param)
-        if value is None and param != 'lib_dir':
-            continue
-        display_name = param.replace('_', ' ').title()
-        if param == 'lib_dir' and value is None:
-            continue
-        logger.info(' %-28s: %s', display_name, value)
-
-
-def _log_config_footer(logger: logging.Logger) -> None:
-    logger.info('')
-    logger.info('=' * 60)
+    """Выводит сводку в лог одной записью вместо отдельной записи на строку."""
+    body = _format_config_sections(config_data)
+    logger.info(
+        '%s',
+        f'{_SUMMARY_RULE}\n{_SUMMARY_TITLE}\n{_SUMMARY_RULE}\n{body}\n\n{_SUMMARY_RULE}',
+    )
 
 
 def _print_config_to_console(
-    sections: list[tuple[str, list[str]]],
     config_data: dict[str, object],
 ) -> None:
-    print('\n' + '=' * 60)
-    print('КОНФИГУРАЦИЯ ПРИЛОЖЕНИЯ')
-    print('=' * 60)
-    for section_name, params in sections:
-        print(f'\n[{section_name}]')
-        print('-' * 40)
-        for param in params:
-            value = config_data.get(param)
-            if value is None and param != 'lib_dir':
-                continue
-            display_name = param.replace('_', ' ').title()
-            if param == 'lib_dir' and value is None:
-                continue
-            print(f' {display_name:28}: {value}')
-    print('=' * 60 + '\n')
+    """Печатает сводку в консоль одной записью в stdout."""
+    body = _format_config_sections(config_data)
+    sys.stdout.write(
+        f'\n{_SUMMARY_RULE}\n{_SUMMARY_TITLE}\n{_SUMMARY_RULE}\n{body}\n{_SUMMARY_RULE}\n\n'
+    )
 
 
 def main() -> None:
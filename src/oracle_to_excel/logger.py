@@ -15,7 +15,7 @@ from collections.abc import Callable, Sequence
 from functools import wraps
 from pathlib import Path
 from time import perf_counter
-from typing import ParamSpec, TypeVar
+from typing import Final, ParamSpec, TypeVar
 
 # Type aliases for improved readability (Python 3.14+)
 type LogLevel = str | int
@@ -26,13 +26,29 @@ P = ParamSpec('P')
 R = TypeVar('R')
 
 # Constants
-DEFAULT_LOG_FORMAT: str = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-DEFAULT_DATE_FORMAT: str = '%Y-%m-%d %H:%M:%S'
-MAX_LOG_FILE_SIZE: int = 10 * 1024 * 1024  # 10 MB
-BACKUP_COUNT: int = 3
+DEFAULT_LOG_FORMAT: Final[str] = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+DEFAULT_DATE_FORMAT: Final[str] = '%Y-%m-%d %H:%M:%S'
+MAX_LOG_FILE_SIZE: Final[int] = 10 * 1024 * 1024  # 10 MB
+BACKUP_COUNT: Final[int] = 3
+_NUMERIC_LEVELS: Final[frozenset[int]] = frozenset((0, 10, 20, 30, 40, 50))
+# Level names in casefold form: one dict lookup instead of upper() + hasattr()
+_LEVELS_BY_NAME: Final[dict[str, int]] = {
+    name.casefold(): level for name, level in logging.getLevelNamesMapping().items()
+}
+
+# Keywords whose values are masked in log messages
+SENSITIVE_KEYWORDS: Final[tuple[str, ...]] = ('password', 'token', 'secret', 'apikey')
+
+# Single pattern for all keywords: one regex pass per record instead of one per keyword
+_SENSITIVE_RE: Final[re.Pattern[str]] = re.compile(
+    rf"(?P<key>{'|'.join(SENSITIVE_KEYWORDS)})[\"']?\s*[:=]\s*[\"']?[^\"'\s]+",
+    re.IGNORECASE,
+)
+_SENSITIVE_REPLACEMENT: Final[str] = r'\g<key>=***'
 
-# Patterns for masking sensitive data
-SENSITIVE_PATTERNS: tuple[tuple[str, str], ...] = (
+# Former public (pattern, replacement) list, kept for backward compatibility
+# with importers; the filter itself uses _SENSITIVE_RE
+SENSITIVE_PATTERNS: Final[tuple[tuple[str, str], ...]] = (
     (r"password[\"']?\s*[:=]\s*[\"']?([^\"'\\s]+)", r'password=***'),
     (r"PASSWORD[\"']?\s*[:=]\s*[\"']?([^\"'\\s]+)", r'PASSWORD=***'),
     (r"token[\"']?\s*[:=]\s*[\"']?([^\"'\\s]+)", r'token=***'),
@@ -52,8 +68,8 @@ def setup_logging(
     """
     Configure logging system with console and file support.
 
-    Uses enhanced Python 3.14 type system and pattern matching
-    for flexible logger configuration.
+    Without a log file the console handler is always added, even when
+    console_output is False.
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL).
@@ -82,22 +98,14 @@ def setup_logging(
     # Create formatter
     formatter = _create_formatter(DEFAULT_LOG_FORMAT, DEFAULT_DATE_FORMAT)
 
-    # Pattern matching for handler configuration (improved in Python 3.14)
-    match (console_output, log_file):
-        case (True, None):
-            # console only
-            _add_console_handler(logger, formatter)
-        case (False, str() | Path() as file):
-            # file only
-            _add_file_handler(logger, formatter, file)
-        case (True, str() | Path() as file):
-            # both console and file
-            _add_console_handler(logger, formatter)
-            _add_file_handler(logger, formatter, file)
-        case (False, None):
-            # Fallback: at least console
-            _add_console_handler(logger, formatter)
-            logger.warning('Logging not configured properly, using console')
+    # Handler configuration: console, file or both
+    if console_output or log_file is None:
+        _add_console_handler(logger, formatter)
+    if log_file is not None:
+        _add_file_handler(logger, formatter, log_file)
+    elif not console_output:
+        # Fallback: at least console
+        logger.warning('Logging not configured properly, using console')
 
     # Add filter for masking sensitive data
     if mask_sensitive:
@@ -116,8 +124,6 @@ def _parse_log_level(level: LogLevel) -> int:
     """
     Convert string logging level to numeric.
 
-    Uses pattern matching for handling various formats.
-
     Args:
         level: Logging level (string or number).
 
@@ -127,23 +133,14 @@ def _parse_log_level(level: LogLevel) -> int:
     Raises:
         ValueError: If level is invalid.
     """
-    match level:
-        case int() as numeric_level if numeric_level in {
-            0,
-            10,
-            20,
-            30,
-            40,
-            50,
-        }:
+    if isinstance(level, str):
+        numeric_level = _LEVELS_BY_NAME.get(level.casefold())
+        if numeric_level is not None:
             return numeric_level
-        case str() as string_level:
-            upper_level = string_level.upper()
-            if hasattr(logging, upper_level):
-                return getattr(logging, upper_level)
-            raise ValueError(f'Invalid logging level: {level}')
-        case _:
-            raise ValueError(f'Unsupported logging level type: {type(level)}')
+        raise ValueError(f'Invalid logging level: {level}')
+    if isinstance(level, int) and level in _NUMERIC_LEVELS:
+        return level
+    raise ValueError(f'Unsupported logging level type: {type(level)}')
 
 
 def _create_formatter(
@@ -269,19 +266,11 @@ def _create_sensitive_filter() -> logging.Filter:
     Returns:
         Instance of logging.Filter implementing .filter(record).
     """
-    compiled_patterns = [
-        (re.compile(pattern, re.IGNORECASE), replacement)
-        for pattern, replacement in SENSITIVE_PATTERNS
-    ]
 
     class SensitiveDataFilter(logging.Filter):
         def filter(self, record: logging.LogRecord) -> bool:
-            original_msg = record.getMessage()
-            filtered_msg = original_msg
-            for pattern, replacement in compiled_patterns:
-                filtered_msg = pattern.sub(replacement, filtered_msg)
-
-            if filtered_msg != original_msg:
+            filtered_msg, count = _SENSITIVE_RE.subn(_SENSITIVE_REPLACEMENT, record.getMessage())
+            if count:
                 record.msg = filtered_msg
                 record.args = ()
 
@@ -371,11 +360,14 @@ def log_function_call[**P, R](
     """
 
     def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        logger = logging.getLogger('oracle_exporter.trace')
+        func_name = f'{func.__module__}.{func.__name__}'
+
         @wraps(func)
         def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            logger = logging.getLogger('oracle_exporter.trace')
-
-            func_name = f'{func.__module__}.{func.__name__}'
+            # Skip argument/result repr() when DEBUG records would be dropped
+            if not logger.isEnabledFor(logging.DEBUG):
+                return func(*args, **kwargs)
 
             # Log call
             if log_args:
@@ -495,14 +487,15 @@ def create_context_logger(
         message: str,
         **extra: str | int | float,
     ) -> None:
+        # Skip building the context string if the record would be dropped
+        numeric_level = _parse_log_level(level)
+        if not logger.isEnabledFor(numeric_level):
+            return
+
         # Merge context and extra parameters
         full_context = {**context, **extra}
         context_str = ' | '.join(f'{k}={v}' for k, v in full_context.items())
-        full_message = f'[{context_str}] {message}'
-
-        # Log with level
-        numeric_level = _parse_log_level(level)
-        logger.log(numeric_level, full_message)
+        logger.log(numeric_level, '[%s] %s', context_str, message)
 
     return log_with_context
 
@@ -1,5 +1,7 @@
 """Main entrypoint for oracle_to_excel tool."""
 
+from __future__ import annotations
+
 import logging
 import sys
 from pathlib import Path
@@ -45,7 +47,7 @@ def _setup_logger_from_default(path: Path) -> logging.Logger:
 def main() -> None:
     """Основная точка входа приложения."""
     # Создаем логгер с дефолтным лог-файлом сразу
-    default_logfile = Path(DEFAULT_CONFIG['LOG_FILE'])
+    default_logfile = Path(cast(str, DEFAULT_CONFIG['LOG_FILE']))
     logger = _setup_logger_from_default(default_logfile)
 
     # 1. Загружаем конфигурацию
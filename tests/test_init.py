@@ -0,0 +1,52 @@
+"""Тесты для пакета `oracle_to_excel` — ленивый экспорт публичных имён."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import oracle_to_excel
+
+SRC_DIR = Path(__file__).parent.parent / 'src'
+
+
+def test_import_does_not_load_submodules() -> None:
+    """`import oracle_to_excel` не импортирует env_config/database."""
+    code = (
+        'import sys, oracle_to_excel\n'
+        "print(any(m in sys.modules for m in ('oracle_to_excel.env_config', "
+        "'oracle_to_excel.database', 'pydantic', 'sqlalchemy')))"
+    )
+    env = {**os.environ, 'PYTHONPATH': str(SRC_DIR)}
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    )
+    assert result.stdout.strip() == 'False'
+
+
+def test_lazy_export_resolves_and_is_cached() -> None:
+    """Первое обращение импортирует модуль, затем имя берётся из globals()."""
+    # импорт внутри теста: модуль должен загрузиться только при обращении
+    from oracle_to_excel.env_config import load_config  # noqa: PLC0415
+
+    assert oracle_to_excel.load_config is load_config
+    assert vars(oracle_to_excel)['load_config'] is load_config
+
+
+def test_unknown_attribute_raises() -> None:
+    """Неизвестные имена дают обычный AttributeError."""
+    with pytest.raises(AttributeError):
+        _ = oracle_to_excel.does_not_exist
+
+
+def test_main_is_not_a_lazy_export() -> None:
+    """`main` не экспортируется: имя занято подмодулем oracle_to_excel.main."""
+    assert 'main' not in oracle_to_excel.__all__
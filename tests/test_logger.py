@@ -10,7 +10,14 @@ import logging
 import time
 from pathlib import Path
 
+import pytest
+
 from oracle_to_excel.logger import (
+    _SENSITIVE_RE,
+    _SENSITIVE_REPLACEMENT,
+    SENSITIVE_KEYWORDS,
+    SENSITIVE_PATTERNS,
+    _parse_log_level,
     create_context_logger,
     log_exception,
     log_execution_time,
@@ -38,6 +45,16 @@ def test_setup_logging_console() -> None:
     logger.warning('Warning message')
 
 
+def test_parse_log_level_names() -> None:
+    """Тест: имя уровня принимается в любом регистре, посторонние имена отклоняются."""
+    assert _parse_log_level('debug') == logging.DEBUG
+    assert _parse_log_level('Warning') == logging.WARNING
+    assert _parse_log_level(logging.ERROR) == logging.ERROR
+
+    with pytest.raises(ValueError, match='Invalid logging level'):
+        _parse_log_level('shutdown')
+
+
 def test_setup_logging_file() -> None:
     """Тест настройки логирования в файл."""
     log_file = Path('test.log')
@@ -78,6 +95,46 @@ def test_sensitive_data_masking() -> None:
     logger.info('Connection with password=secret123 and token=abc456')
 
 
+def test_sensitive_data_masked_in_records(caplog) -> None:
+    """Тест: значения всех чувствительных ключей заменяются на ***."""
+    logger = setup_logging(
+        log_level='DEBUG',
+        console_output=True,
+        mask_sensitive=True,
+    )
+
+    with caplog.at_level(logging.INFO, logger='oracle_exporter'):
+        logger.info('user=%s PASSWORD=%s token: %s', 'scott', 'secret123', 'abc456')
+
+    assert 'secret123' not in caplog.text
+    assert 'abc456' not in caplog.text
+    assert 'PASSWORD=***' in caplog.text
+    assert 'token=***' in caplog.text
+    assert 'user=scott' in caplog.text
+
+
+def test_sensitive_patterns_kept_for_compatibility() -> None:
+    """Тест: прежний SENSITIVE_PATTERNS доступен и покрывает те же ключи."""
+    replacements = {replacement.split('=')[0].lower() for _, replacement in SENSITIVE_PATTERNS}
+    assert replacements == set(SENSITIVE_KEYWORDS)
+
+
+@pytest.mark.parametrize(
+    'key',
+    [replacement.split('=')[0] for _, replacement in SENSITIVE_PATTERNS],
+)
+@pytest.mark.parametrize('separator', ['=', ': ', ' = ', '="'])
+def test_sensitive_re_masks_legacy_keys(key: str, separator: str) -> None:
+    """Тест: объединённый шаблон маскирует каждый ключ из SENSITIVE_PATTERNS."""
+    message = f'connect {key}{separator}s3cr3tValue done'
+
+    masked = _SENSITIVE_RE.sub(_SENSITIVE_REPLACEMENT, message)
+
+    assert 's3cr3tValue' not in masked
+    assert f'{key}=***' in masked
+    assert masked.endswith(' done')
+
+
 def test_log_execution_time_decorator() -> None:
     """Тест декоратора логирования времени выполнения."""
 
@@ -101,6 +158,30 @@ def test_log_function_call_decorator() -> None:
     assert result == 5
 
 
+def test_log_function_call_skips_repr_when_debug_disabled(caplog) -> None:
+    """Тест: при отключённом DEBUG аргументы не форматируются через repr()."""
+
+    class Probe:
+        calls = 0
+
+        def __repr__(self) -> str:
+            Probe.calls += 1
+            return 'Probe()'
+
+    @log_function_call(log_args=True, log_result=True)
+    def identity(value: Probe) -> Probe:
+        return value
+
+    with caplog.at_level(logging.INFO, logger='oracle_exporter.trace'):
+        identity(Probe())
+    assert Probe.calls == 0
+
+    with caplog.at_level(logging.DEBUG, logger='oracle_exporter.trace'):
+        identity(Probe())
+    assert 'Call: ' in caplog.text
+    assert Probe.calls > 0
+
+
 def test_exception_logging() -> None:
     """Тест логирования исключений."""
     logger = setup_logging('DEBUG', console_output=True)
@@ -125,3 +206,16 @@ def test_context_logging() -> None:
     context_log('INFO', 'Operation completed successfully')
     # Дополнительный вызов с другой сессией
     context_log('WARNING', 'Some warning')
+
+
+def test_context_logging_respects_level(caplog) -> None:
+    """Тест: контекст добавляется к сообщению, отфильтрованные уровни не пишутся."""
+    logger = setup_logging('INFO', console_output=True)
+    context_log = create_context_logger(logger, session='TEST001')
+
+    with caplog.at_level(logging.INFO, logger='oracle_exporter'):
+        context_log('DEBUG', 'Hidden message')
+        context_log('INFO', 'Visible message', step=2)
+
+    assert 'Hidden message' not in caplog.text
+    assert '[session=TEST001 | step=2] Visible message' in caplog.text